@@ -238,6 +238,12 @@ class CameraControl(QtCore.QThread):
     def handleFinished(self):
         self.camera_functionality.stopped.emit()
         
+    #
+    # This slot is hit once per batch of frames for the life of the camera,
+    # so it is declared explicitly rather than letting PyQt create a
+    # dynamic slot for it at connection time.
+    #
+    @QtCore.pyqtSlot(object)
     def handleNewData(self, frames):
         """
         Data from the camera should go through this method on it's
@@ -15,6 +15,12 @@ class Frame(object):
     Class for the storage of a single frame of camera data
     and it's meta-information.
     """
+    #
+    # These objects are created at the camera frame rate, so __slots__ is
+    # used to skip the per instance __dict__. This makes them smaller and
+    # makes attribute access a little faster.
+    #
+    __slots__ = ["image_x", "image_y", "np_data", "frame_number", "which_camera"]
 
     def __init__(self, np_data, frame_number, image_x, image_y, which_camera):
         """
@@ -54,14 +54,14 @@ class PointGreyCameraControl(cameraControl.HWCameraControl):
                     set_value = self.camera.getProperty(p_name).getValue() # Check set
                     print("   " + str(p_name) + ": " + str(p_value) + " (" + str(set_value) + ")")
                 else:
-                    if p_name not in self.exposure_control.keys():
+                    if p_name not in self.exposure_control:
                         print("!!!! preset " + str(p_name) + " is not a valid parameter for this camera")
             
             # Set the exposure-frame-rate-control parameters
             self.exposure_control["CameraControlExposure"] = presets.get("CameraControlExposure", True)
             print("Set exposure control properties:")
-            for key in self.exposure_control.keys():
-                print("   " + str(key) + ": " + str(self.exposure_control[key]))
+            for key, value in self.exposure_control.items():
+                print("   " + str(key) + ": " + str(value))
                 
         else:
             print("No presets provided for spinnaker camera: " + str(config.get("camera_id")))
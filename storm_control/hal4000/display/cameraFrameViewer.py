@@ -398,6 +398,7 @@ class CameraFrameViewer(QtWidgets.QFrame):
         self.setParameter("center_y", cy)
         self.camera_widget.setClickPos(*self.cam_fn.transformChipToFrame(cx, cy))
 
+    @QtCore.pyqtSlot(object)
     def handleNewFrame(self, frame):
         if self.filming and (self.getParameter("sync") != 0):
             if((frame.frame_number % self.cycle_length) == (self.getParameter("sync") - 1)):
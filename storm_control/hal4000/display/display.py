@@ -154,12 +154,12 @@ class Display(halModule.HalModule):
         elif message.isType("new parameters"):
             p = message.getData()["parameters"]
             for viewer in self.viewers:
+                response_data = {"old parameters" : viewer.getParameters().copy()}
                 message.addResponse(halMessage.HalMessageResponse(source = viewer.getViewerName(),
-                                                                  data = {"old parameters" : viewer.getParameters().copy()}))
+                                                                  data = response_data))
                 viewer.newParameters(p.get(viewer.getViewerName(),
                                            viewer.getDefaultParameters()))
-                message.addResponse(halMessage.HalMessageResponse(source = viewer.getViewerName(),
-                                                                  data = {"new parameters" : viewer.getParameters()}))
+                response_data["new parameters"] = viewer.getParameters()
 
         elif message.isType("show"):
             if (message.getData()["show"] == "new camera viewer"):
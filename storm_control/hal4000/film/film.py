@@ -422,6 +422,26 @@ class Film(halModule.HalModule):
                               validator = {"data" : None,
                                            "resp" : None})
 
+        # Dispatch table for processMessage(). A dictionary lookup on the
+        # message type replaces a walk down an if/elif chain of isType()
+        # calls for every message.
+        self.message_handlers = {"change directory" : self.handleChangeDirectory,
+                                 "configuration" : self.handleConfiguration,
+                                 "configure1" : self.handleConfigure1,
+                                 "current parameters" : self.handleCurrentParameters,
+                                 "live mode" : self.handleLiveMode,
+                                 "new parameters" : self.handleNewParameters,
+                                 "new shutters file" : self.handleNewShuttersFile,
+                                 "ready to film" : self.handleReadyToFilm,
+                                 "start" : self.handleStart,
+                                 "start camera" : self.handleStartCamera,
+                                 "start film request" : self.handleStartFilmRequest,
+                                 "stop camera" : self.handleStopCamera,
+                                 "stop film" : self.handleStopFilm,
+                                 "stop film request" : self.handleStopFilmRequest,
+                                 "updated parameters" : self.handleUpdatedParameters,
+                                 "wait for" : self.handleWaitFor}
+
     def cleanUp(self, qt_settings):
         if self.logfile_fp is not None:
             self.logfile_fp.close()
@@ -510,125 +530,138 @@ class Film(halModule.HalModule):
             # Now that everything is complete end the filming lock out.
             self.setLockout(False, acquisition_parameters = acq_p)
 
-    def handleStopCamera(self):
+    def handleCamerasStopped(self):
         if (self.film_state == "start"):
             self.startFilmingLevel2()
         elif (self.film_state == "stop"):
             self.stopFilmingLevel2()
 
-    def processMessage(self, message):
-
-        if message.isType("change directory"):
-            self.view.setDirectory(message.getData()["directory"])
-                    
-        elif message.isType("configuration"):
-            if message.sourceIs("feeds"):
-                self.camera_functionalities = []
-                for name in message.getData()["properties"]["feed names"]:
-                    self.sendMessage(halMessage.HalMessage(m_type = "get functionality",
-                                                           data = {"name" : name}))
-                    self.number_fn_requested += 1
-
-            elif message.sourceIs("illumination"):
-                properties = message.getData()["properties"]
-                if "shutters filename" in properties:
-                    self.view.setShutters(properties["shutters filename"])
-
-            elif message.sourceIs("mosaic"):
-                #
-                # We need to keep track of the current value so that
-                # we can save this in the tif images / stacks.
-                #
-                self.pixel_size = message.getData()["properties"]["pixel_size"]
-                    
-            elif message.sourceIs("timing"):
-                #
-                # We'll get this message from timing.timing, the part we are interested in is
-                # the timing functionality which we will use both to update the frame counter
-                # and to know when a fixed length film is complete.
-                #
-                self.timing_functionality = message.getData()["properties"]["functionality"]
-                self.timing_functionality.newFrame.connect(self.handleNewFrame)
-                self.timing_functionality.stopped.connect(self.stopFilmingLevel1)
-
-        elif message.isType("configure1"):
-            self.sendMessage(halMessage.HalMessage(m_type = "add to ui",
-                                                   data = self.configure_dict))
-                
-            self.sendMessage(halMessage.HalMessage(m_type = "initial parameters",
-                                                   data = {"parameters" : self.view.getParameters()}))
+    def handleWriterFinished(self):
+        """
+        A writer that stopFilmingLevel2() was waiting on has stopped.
+        """
+        writer = self.sender()
+        writer.finished.disconnect(self.handleWriterFinished)
+        self.stopFilmingLevel2()
+
+    def handleChangeDirectory(self, message):
+        self.view.setDirectory(message.getData()["directory"])
+
+    def handleConfiguration(self, message):
+        if message.sourceIs("feeds"):
+            self.camera_functionalities = []
+            for name in message.getData()["properties"]["feed names"]:
+                self.sendMessage(halMessage.HalMessage(m_type = "get functionality",
+                                                       data = {"name" : name}))
+                self.number_fn_requested += 1
+
+        elif message.sourceIs("illumination"):
+            properties = message.getData()["properties"]
+            if "shutters filename" in properties:
+                self.view.setShutters(properties["shutters filename"])
+
+        elif message.sourceIs("mosaic"):
+            #
+            # We need to keep track of the current value so that
+            # we can save this in the tif images / stacks.
+            #
+            self.pixel_size = message.getData()["properties"]["pixel_size"]
 
-            # Let the settings.settings module know that it needs
-            # to wait for us during a parameter change.
-            self.sendMessage(halMessage.HalMessage(m_type = "wait for",
-                                                   data = {"module names" : ["settings"]}))
+        elif message.sourceIs("timing"):
+            #
+            # We'll get this message from timing.timing, the part we are interested in is
+            # the timing functionality which we will use both to update the frame counter
+            # and to know when a fixed length film is complete.
+            #
+            self.timing_functionality = message.getData()["properties"]["functionality"]
+            self.timing_functionality.newFrame.connect(self.handleNewFrame)
+            self.timing_functionality.stopped.connect(self.stopFilmingLevel1)
 
-        elif message.isType("current parameters"):
-            message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"parameters" : self.view.getParameters().copy()}))
+    def handleConfigure1(self, message):
+        self.sendMessage(halMessage.HalMessage(m_type = "add to ui",
+                                               data = self.configure_dict))
 
-        elif message.isType("live mode") and message.sourceIs("testing"):
-            self.view.setLiveMode(message.getData()["live mode"])
+        self.sendMessage(halMessage.HalMessage(m_type = "initial parameters",
+                                               data = {"parameters" : self.view.getParameters()}))
 
-        elif message.isType("new parameters"):
-            if self.locked_out:
-                raise halExceptions.HalException("'new parameters' received while locked out.")
-            message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"old parameters" : self.view.getParameters().copy()}))
-            # Update parameters.
-            self.view.newParameters(message.getData()["parameters"].get(self.module_name))
-            message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"new parameters" : self.view.getParameters()}))
+        # Let the settings.settings module know that it needs
+        # to wait for us during a parameter change.
+        self.sendMessage(halMessage.HalMessage(m_type = "wait for",
+                                               data = {"module names" : ["settings"]}))
 
+    def handleCurrentParameters(self, message):
+        # Note: self.view.getParameters() already returns a copy.
+        message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
+                                                          data = {"parameters" : self.view.getParameters()}))
 
-        elif message.isType("new shutters file"):
-            self.view.setShutters(message.getData()["filename"])
+    def handleLiveMode(self, message):
+        if message.sourceIs("testing"):
+            self.view.setLiveMode(message.getData()["live mode"])
 
-        elif message.isType("ready to film"):
-            self.waiting_on.remove(message.getSourceName())
+    def handleNewParameters(self, message):
+        if self.locked_out:
+            raise halExceptions.HalException("'new parameters' received while locked out.")
+        # Note: self.view.getParameters() already returns a copy.
+        response_data = {"old parameters" : self.view.getParameters()}
+        message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
+                                                          data = response_data))
+        # Update parameters.
+        self.view.newParameters(message.getData()["parameters"].get(self.module_name))
+        response_data["new parameters"] = self.view.getParameters()
+
+    def handleNewShuttersFile(self, message):
+        self.view.setShutters(message.getData()["filename"])
+
+    def handleReadyToFilm(self, message):
+        self.waiting_on.remove(message.getSourceName())
+
+        # All modules are ready, so start the cameras.
+        if (len(self.waiting_on) == 0):
+            self.startCameras()
 
-            # All modules are ready, so start the cameras.
-            if (len(self.waiting_on) == 0):
-                self.startCameras()
+    def handleStart(self, message):
+        if self.view.amInLiveMode():
+            self.startCameras()
 
-        elif message.isType("start"):
-            if self.view.amInLiveMode():
-                self.startCameras()
+    def handleStartCamera(self, message):
+        if self.locked_out and (message.getSource() != self):
+            raise halExceptions.HalException("'start camera' received while locked out.")
+
+    def handleStartFilmRequest(self, message):
+        if self.locked_out:
+            raise halExceptions.HalException("'start film request' received while locked out.")
+        self.setLockout(True)
+        film_settings = self.view.getFilmSettings(message.getData()["request"])
+        if film_settings is not None:
+            film_settings.setPixelSize(self.pixel_size)
+            self.startFilmingLevel1(film_settings)
+        else:
+            self.setLockout(False)
 
-        elif message.isType("start camera"):
-            if self.locked_out and (message.getSource() != self):
-                raise halExceptions.HalException("'start camera' received while locked out.")
-
-        elif message.isType("start film request"):
-            if self.locked_out:
-                raise halExceptions.HalException("'start film request' received while locked out.")
-            self.setLockout(True)
-            film_settings = self.view.getFilmSettings(message.getData()["request"])
-            if film_settings is not None:
-                film_settings.setPixelSize(self.pixel_size)
-                self.startFilmingLevel1(film_settings)
-            else:
-                self.setLockout(False)
+    def handleStopCamera(self, message):
+        if self.locked_out and (message.getSource() != self):
+            raise halExceptions.HalException("'stop camera' received while locked out.")
 
-        elif message.isType("stop camera"):
-            if self.locked_out and (message.getSource() != self):
-                raise halException.HalException("'stop camera' received while locked out.")
+    def handleStopFilm(self, message):
+        message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
+                                                          data = {"parameters" : self.view.getParameters()}))
 
-        elif message.isType("stop film"):
-            message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"parameters" : self.view.getParameters()}))
+    def handleStopFilmRequest(self, message):
+        if (self.film_state != "run"):
+            raise halExceptions.HalException("Stop film request received while not filming.")
+        self.stopFilmingLevel1()
 
-        elif message.isType("stop film request"):
-            if (self.film_state != "run"):
-                raise halExceptions.HalException("Stop film request received while not filming.")
-            self.stopFilmingLevel1()
+    def handleUpdatedParameters(self, message):
+        self.parameter_change = True
 
-        elif message.isType("updated parameters"):
-            self.parameter_change = True
+    def handleWaitFor(self, message):
+        if self.module_name in message.getData()["module names"]:
+            self.wait_for.append(message.getSourceName())
 
-        elif message.isType("wait for"):
-            if self.module_name in message.getData()["module names"]:
-                self.wait_for.append(message.getSourceName())
+    def processMessage(self, message):
+        handler = self.message_handlers.get(message.m_type)
+        if handler is not None:
+            handler(message)
 
     def setLockout(self, state, acquisition_parameters = None):
         self.locked_out = state
@@ -713,7 +746,7 @@ class Film(halModule.HalModule):
         # Stop slave cameras last.
         self.sendMessage(halMessage.HalMessage(m_type = "stop camera",
                                                data = {"master" : False},
-                                               finalizer = self.handleStopCamera))
+                                               finalizer = self.handleCamerasStopped))
 
     def stopFilmingLevel1(self):
         """
@@ -739,14 +772,18 @@ class Film(halModule.HalModule):
         
         # Check that the writers have stopped. The problem (I think) is a race condition
         # where the 'stopped' signal from the Camera has not reached the functionalities
-        # of the writers before the handleStopCamera() finalizer for the 'stop camera'
-        # message calls this function. If any of the writers have not stopped we wait
-        # ~10ms and try again.
+        # of the writers before the handleCamerasStopped() finalizer for the 'stop camera'
+        # message calls this function. If a writer has not stopped wait for its
+        # finished signal, keeping the timer as a safety fallback.
         for writer in self.writers:
             if not writer.isStopped():
+                writer.finished.connect(self.handleWriterFinished)
                 self.writers_stopped_timer.start()
                 return
 
+        # Make sure the safety fallback timer doesn't fire after we are done.
+        self.writers_stopped_timer.stop()
+
         # Close writers.
         for writer in self.writers:
             writer.closeWriter()
@@ -4,8 +4,6 @@
 
 Hazen 04/17
 """
-import importlib
-
 from PyQt5 import QtCore, QtWidgets
 
 import storm_control.sc_library.parameters as params
@@ -233,13 +231,73 @@ class FocusLock(halModule.HalModule):
         halMessage.addMessage("lock jump",
                               validator = {"data" : {"delta" : [True, float]},
                                            "resp" : None})
-        
+
+        # Dispatch table for processMessage(). A dictionary lookup on the
+        # message type is O(1), walking an if/elif chain of isType() calls
+        # is O(N) per message.
+        self.message_handlers = {"configuration" : self.handleConfiguration,
+                                 "configure1" : self.handleConfigure1,
+                                 "configure2" : self.handleConfigure2,
+                                 "lock jump" : self.handleLockJump,
+                                 "new parameters" : self.handleNewParameters,
+                                 "show" : self.handleShow,
+                                 "start" : self.handleStart,
+                                 "start film" : self.handleStartFilm,
+                                 "stop film" : self.handleStopFilm,
+                                 "tcp message" : self.handleTCPMessage}
+
     def cleanUp(self, qt_settings):
         self.view.cleanUp(qt_settings)
 
+    def handleConfiguration(self, message):
+        if message.sourceIs("timing"):
+            self.control.setTimingFunctionality(message.getData()["properties"]["functionality"])
+
+    def handleConfigure1(self, message):
+        self.sendMessage(halMessage.HalMessage(m_type = "add to menu",
+                                               data = {"item name" : "Focus Lock",
+                                                       "item data" : "focus lock"}))
+
+        self.sendMessage(halMessage.HalMessage(m_type = "initial parameters",
+                                               data = {"parameters" : self.view.getParameters()}))
+
+        # Tell other modules the names of the various functionalities related to the
+        # focus lock.
+        self.sendMessage(halMessage.HalMessage(m_type = "configuration",
+                                               data = {"properties" : {"ir laser functionality name" : self.configuration.get("ir_laser"),
+                                                                       "qpd functionality name" : self.configuration.get("qpd"),
+                                                                       "z stage functionality name" : self.configuration.get("z_stage")}}))
+
+    def handleConfigure2(self, message):
+        # Get functionalities. Do this here because the modules that provide these functionalities
+        # will likely need functionalities from other modules. The IR laser for example might
+        # need a functionality from a DAQ module.
+        self.sendMessage(halMessage.HalMessage(m_type = "get functionality",
+                                               data = {"name" : self.configuration.get("ir_laser"),
+                                                       "extra data" : "ir_laser"}))
+
+        self.sendMessage(halMessage.HalMessage(m_type = "get functionality",
+                                               data = {"name" : self.configuration.get("qpd"),
+                                                       "extra data" : "qpd"}))
+
+        self.sendMessage(halMessage.HalMessage(m_type = "get functionality",
+                                               data = {"name" : self.configuration.get("z_stage"),
+                                                       "extra data" : "z_stage"}))
+
     def handleControlMessage(self, message):
         self.sendMessage(message)
 
+    def handleLockJump(self, message):
+        self.control.handleJump(message.getData()["delta"])
+
+    def handleNewParameters(self, message):
+        p = message.getData()["parameters"]
+        response_data = {"old parameters" : self.view.getParameters().copy()}
+        message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
+                                                          data = response_data))
+        self.view.newParameters(p.get(self.module_name))
+        response_data["new parameters"] = self.view.getParameters()
+
     def handleResponse(self, message, response):
         if message.isType("get functionality"):
             self.control.setFunctionality(message.getData()["extra data"],
@@ -247,97 +305,53 @@ class FocusLock(halModule.HalModule):
             self.view.setFunctionality(message.getData()["extra data"],
                                        response.getData()["functionality"])
             
-    def processMessage(self, message):
-
-        if message.isType("configuration"):
-            if message.sourceIs("timing"):
-                self.control.setTimingFunctionality(message.getData()["properties"]["functionality"])
-
-        elif message.isType("configure1"):
-            self.sendMessage(halMessage.HalMessage(m_type = "add to menu",
-                                                   data = {"item name" : "Focus Lock",
-                                                           "item data" : "focus lock"}))
+    def handleShow(self, message):
+        if (message.getData()["show"] == "focus lock"):
+            self.view.show()
+
+    def handleStart(self, message):
+        self.view.start()
+        self.control.start()
+        if message.getData()["show_gui"]:
+            self.view.showIfVisible()
+
+    def handleStartFilm(self, message):
+        self.control.startFilm(message.getData()["film settings"])
+
+    def handleStopFilm(self, message):
+        self.control.stopFilm()
+        message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
+                                                          data = {"parameters" : self.view.getParameters().copy()}))
+        lock_good = params.ParameterSetBoolean(name = "good_lock",
+                                               value = self.control.isGoodLock())
+        lock_mode = params.ParameterString(name = "lock_mode",
+                                           value = self.control.getLockModeName())
+        lock_sum = params.ParameterFloat(name = "lock_sum",
+                                            value = self.control.getQPDSumSignal())
+        lock_target = params.ParameterFloat(name = "lock_target",
+                                            value = self.control.getLockTarget())
+        message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
+                                                          data = {"acquisition" : [lock_good,
+                                                                                   lock_mode,
+                                                                                   lock_sum,
+                                                                                   lock_target]}))
 
-            self.sendMessage(halMessage.HalMessage(m_type = "initial parameters",
-                                                   data = {"parameters" : self.view.getParameters()}))
-
-            # Tell other modules the names of the various functionalities related to the
-            # focus lock.
-            self.sendMessage(halMessage.HalMessage(m_type = "configuration",
-                                                   data = {"properties" : {"ir laser functionality name" : self.configuration.get("ir_laser"),
-                                                                           "qpd functionality name" : self.configuration.get("qpd"),
-                                                                           "z stage functionality name" : self.configuration.get("z_stage")}}))
-
-        elif message.isType("configure2"):
-            
-            # Get functionalities. Do this here because the modules that provide these functionalities
-            # will likely need functionalities from other modules. The IR laser for example might
-            # need a functionality from a DAQ module.
-            self.sendMessage(halMessage.HalMessage(m_type = "get functionality",
-                                                   data = {"name" : self.configuration.get("ir_laser"),
-                                                           "extra data" : "ir_laser"}))
-
-            self.sendMessage(halMessage.HalMessage(m_type = "get functionality",
-                                                   data = {"name" : self.configuration.get("qpd"),
-                                                           "extra data" : "qpd"}))
-            
-            self.sendMessage(halMessage.HalMessage(m_type = "get functionality",
-                                                   data = {"name" : self.configuration.get("z_stage"),
-                                                           "extra data" : "z_stage"}))
-
-        elif message.isType("lock jump"):
-            self.control.handleJump(message.getData()["delta"])
-            
-        elif message.isType("new parameters"):
-            p = message.getData()["parameters"]
-            message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"old parameters" : self.view.getParameters().copy()}))
-            self.view.newParameters(p.get(self.module_name))
-            message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"new parameters" : self.view.getParameters()}))
-
-        elif message.isType("show"):
-            if (message.getData()["show"] == "focus lock"):
-                self.view.show()
+    def handleTCPMessage(self, message):
 
-        elif message.isType("start"):
-            self.view.start()
-            self.control.start()
-            if message.getData()["show_gui"]:
-                self.view.showIfVisible()
+        # See control handles this message.
+        handled = self.control.handleTCPMessage(message)
 
-        elif message.isType("start film"):
-            self.control.startFilm(message.getData()["film settings"])
+        # If not, check view.
+        if not handled:
+            handled = self.view.handleTCPMessage(message)
 
-        elif message.isType("stop film"):
-            self.control.stopFilm()
-            message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"parameters" : self.view.getParameters().copy()}))
-            lock_good = params.ParameterSetBoolean(name = "good_lock",
-                                                   value = self.control.isGoodLock())
-            lock_mode = params.ParameterString(name = "lock_mode",
-                                               value = self.control.getLockModeName())
-            lock_sum = params.ParameterFloat(name = "lock_sum",
-                                                value = self.control.getQPDSumSignal())
-            lock_target = params.ParameterFloat(name = "lock_target",
-                                                value = self.control.getLockTarget())
+        # Mark if we handled the message.
+        if handled:
             message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"acquisition" : [lock_good,
-                                                                                       lock_mode,
-                                                                                       lock_sum,
-                                                                                       lock_target]}))
-
-        elif message.isType("tcp message"):
+                                                              data = {"handled" : True}))
 
-            # See control handles this message.
-            handled = self.control.handleTCPMessage(message)
-
-            # If not, check view.
-            if not handled:
-                handled = self.view.handleTCPMessage(message)
-
-            # Mark if we handled the message.
-            if handled:
-                message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                                  data = {"handled" : True}))
+    def processMessage(self, message):
+        handler = self.message_handlers.get(message.m_type)
+        if handler is not None:
+            handler(message)
 
@@ -12,6 +12,12 @@ import tifffile
 import storm_control.hal4000.halLib.halMessage as halMessage
 
 
+# Pre-bound formatters for the per frame offset file lines. Binding the
+# format method once at import saves an attribute lookup per camera frame.
+formatOffsetLine = "{0:d} {1:.6f} {2:.6f} {3:.6f} {4:0d}\n".format
+formatOffsetLineTiff = "{0:d} {1:.6f} {2:.6f} {3:.6f} {4:0d} {5:0d}\n".format
+
+
 class LockControl(QtCore.QObject):
     controlMessage = QtCore.pyqtSignal(object)
 
@@ -54,11 +60,12 @@ class LockControl(QtCore.QObject):
             self.handleDone(True)
 
         else:
-            self.current_state["num_checks"] -= 1
+            current_state = self.current_state
+            current_state["num_checks"] -= 1
 
             # Start a scan if we still don't have a good lock.
-            if (self.current_state["num_checks"] == 0):
-                tcp_message = self.current_state["tcp_message"]
+            if (current_state["num_checks"] == 0):
+                tcp_message = current_state["tcp_message"]
             
                 # Start (find offset) scan mode.
                 if tcp_message.getData("focus_scan"):
@@ -146,7 +153,12 @@ class LockControl(QtCore.QObject):
         self.z_stage_functionality.recenter()
 
     def handleNewFrame(self, frame):
-        if self.offset_fp is not None:
+        #
+        # This runs once per camera frame, so the attributes that are used
+        # more than once are bound to locals.
+        #
+        offset_fp = self.offset_fp
+        if offset_fp is not None:
             frame_number = frame.frame_number + 1
             pos_dict = self.lock_mode.getQPDState()
             is_good = int(pos_dict["is_good"])
@@ -156,20 +168,20 @@ class LockControl(QtCore.QObject):
 
             # In diagnostics mode, add a column for the current tiff image from the QPD.
             if self.tiff_counter is not None:
-                self.offset_fp.write("{0:d} {1:.6f} {2:.6f} {3:.6f} {4:0d} {5:0d}\n".format(frame_number,
-                                                                                            offset,
-                                                                                            power,
-                                                                                            stage_z,
-                                                                                            is_good,
-                                                                                            self.tiff_counter))
+                offset_fp.write(formatOffsetLineTiff(frame_number,
+                                                     offset,
+                                                     power,
+                                                     stage_z,
+                                                     is_good,
+                                                     self.tiff_counter))
 
             # Otherwise save as normal.
             else:
-                self.offset_fp.write("{0:d} {1:.6f} {2:.6f} {3:.6f} {4:0d}\n".format(frame_number,
-                                                                                     offset,
-                                                                                     power,
-                                                                                     stage_z,
-                                                                                     is_good))
+                offset_fp.write(formatOffsetLine(frame_number,
+                                                 offset,
+                                                 power,
+                                                 stage_z,
+                                                 is_good))
         self.lock_mode.handleNewFrame(frame)
 
     def handleQPDUpdate(self, qpd_dict):
@@ -254,10 +266,12 @@ class LockControl(QtCore.QObject):
                 
             else:
 
-                # Check if we already have enough sum signal.
-                if (self.getQPDSumSignal() > tcp_message.getData("min_sum")):
+                # Check if we already have enough sum signal. Query the QPD
+                # state once and re-use the value in the response.
+                qpd_sum = self.getQPDSumSignal()
+                if (qpd_sum > tcp_message.getData("min_sum")):
                     tcp_message.addResponse("focus_status", True)
-                    tcp_message.addResponse("found_sum", self.getQPDSumSignal())
+                    tcp_message.addResponse("found_sum", qpd_sum)
 
                 # If not, start scanning.
                 else:
@@ -322,7 +336,12 @@ class LockControl(QtCore.QObject):
                     self.tiff_fp = tifffile.TiffWriter(film_settings.getBasename() + "_qpd.tif",
                                                        bigtiff = True)
 
-                self.offset_fp = open(film_settings.getBasename() + ".off", "w")
+                #
+                # Use a large buffer so that the per frame writes in
+                # handleNewFrame() don't each turn into a write syscall.
+                # The file is flushed when it is closed in stopFilm().
+                #
+                self.offset_fp = open(film_settings.getBasename() + ".off", "w", buffering = 65536)
 
                 headers = ["frame", "offset", "power", "stage-z", "good-offset"]
                 if self.tiff_fp is not None:
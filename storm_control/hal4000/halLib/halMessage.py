@@ -227,7 +227,7 @@ class HalMessageException(halExceptions.HalException):
 
 
 class HalMessage(QtCore.QObject):
-    istype_warned = {}    
+    istype_warned = set()
     processed = QtCore.pyqtSignal(object)
 
     def __init__(self,
@@ -349,7 +349,7 @@ class HalMessage(QtCore.QObject):
             if (not m_type in valid_messages) and (not m_type in self.istype_warned):
                 #raise HalMessageException("'" + m_type + "' is not a valid message type.")
                 print(">> Warning '" + m_type + "' is not a valid message type. <<")
-                self.istype_warned[m_type] = True
+                self.istype_warned.add(m_type)
         return (self.m_type == m_type)
 
     def logEvent(self, event_name):
@@ -62,7 +62,11 @@ def createFileWriter(camera_functionality, film_settings):
         raise ImageWriterException("Unknown output file format '" + ft + "'")
 
 
-class BaseFileWriter(object):
+class BaseFileWriter(QtCore.QObject):
+
+    # Emitted once the writer has seen the 'stopped' signal from its
+    # camera functionality, i.e. no more frames are coming.
+    finished = QtCore.pyqtSignal()
 
     def __init__(self, camera_functionality = None, film_settings = None, **kwds):
         super().__init__(**kwds)
@@ -94,6 +98,7 @@ class BaseFileWriter(object):
     
     def handleStopped(self):
         self.stopped = True
+        self.finished.emit()
 
     def isStopped(self):
         return self.stopped
@@ -357,12 +357,12 @@ class Illumination(halModule.HalModule):
 
         elif message.isType("new parameters"):
             p = message.getData()["parameters"]
+            response_data = {"old parameters" : self.view.getParameters().copy()}
             message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"old parameters" : self.view.getParameters().copy()}))
+                                                              data = response_data))
             self.view.setXMLDirectory(os.path.dirname(p.get("parameters_file")))
             self.view.newParameters(p.get(self.module_name))
-            message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"new parameters" : self.view.getParameters()}))
+            response_data["new parameters"] = self.view.getParameters()
 
         elif message.isType("new shutters file"):
             self.view.newShutters(message.getData()["filename"])
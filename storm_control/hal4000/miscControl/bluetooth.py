@@ -14,6 +14,7 @@ from PyQt5 import QtCore, QtGui
 import time
 import traceback
 
+import storm_control.sc_library.hdebug as hdebug
 import storm_control.sc_library.parameters as params
 
 import storm_control.hal4000.film.filmRequest as filmRequest
@@ -96,8 +97,8 @@ class BluetoothControl(QtCore.QThread):
                                         profiles = [bluetooth.SERIAL_PORT_PROFILE])
             
         except bluetooth.btcommon.BluetoothError:
-            print(traceback.format_exc())
-            print("Failed to start Bluetooth")
+            hdebug.logText(traceback.format_exc())
+            hdebug.logText("Failed to start Bluetooth", to_console = True)
             have_bluetooth = False
 
         if have_bluetooth:
@@ -500,11 +501,11 @@ class BlueToothModule(halModule.HalModule):
 
         elif message.isType("new parameters"):
             p = message.getData()["parameters"]
+            response_data = {"old parameters" : self.bt_control.getParameters().copy()}
             message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"old parameters" : self.bt_control.getParameters().copy()}))
+                                                              data = response_data))
             self.bt_control.newParameters(p.get(self.module_name))
-            message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"new parameters" : self.bt_control.getParameters()}))
+            response_data["new parameters"] = self.bt_control.getParameters()
 
 
             
@@ -78,8 +78,9 @@ class Mosaic(halModule.HalModule):
             self.sendPixelSize(getObjectivePixelSize(self.parameters))
 
         elif message.isType("new parameters"):
+            response_data = {"old parameters" : self.parameters.copy()}
             message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"old parameters" : self.parameters.copy()}))
+                                                              data = response_data))
 
             # Update parameters.
             p = message.getData()["parameters"].get(self.module_name)
@@ -90,8 +91,7 @@ class Mosaic(halModule.HalModule):
                 
                 self.sendPixelSize(getObjectivePixelSize(self.parameters))
 
-            message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"new parameters" : self.parameters}))
+            response_data["new parameters"] = self.parameters
 
         elif message.isType("stop film"):
             message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
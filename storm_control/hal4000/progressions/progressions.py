@@ -563,11 +563,11 @@ class Progressions(halModule.HalModule):
             
         elif message.isType("new parameters"):
             p = message.getData()["parameters"]
+            response_data = {"old parameters" : self.view.getParameters().copy()}
             message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"old parameters" : self.view.getParameters().copy()}))
+                                                              data = response_data))
             self.view.newParameters(p.get(self.module_name))
-            message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"new parameters" : self.view.getParameters()}))
+            response_data["new parameters"] = self.view.getParameters()
             
         elif message.isType("show"):
             if (message.getData()["show"] == "progressions"):
@@ -96,13 +96,14 @@ class Settings(halModule.HalModule):
         # defer actually re-configuring until they receive the
         # 'updated parameters' message.
         #
-        # Other modules that respond should send two response:
-        #  1. A response with a copy of their old parameter as "old parameters".
-        #  2. A response with their updated parameters as "new parameters".
+        # Other modules that respond should add a single response with a copy
+        # of their old parameters as "old parameters", then add their updated
+        # parameters to the same response data as "new parameters" once the
+        # update succeeds.
         #
-        # The response is structured this way so that if an error occurs
-        # during the parameter update we still have a record of the last
-        # good state in "old parameters".
+        # The response is attached before the update starts so that if an
+        # error occurs during the parameter update we still have a record of
+        # the last good state in "old parameters".
         #
         # Notes:
         #   1. We send a copy of the parameters in the listview, so if the
@@ -324,11 +324,11 @@ class SpotCounter(halModule.HalModule):
             # from feeds.feeds we'll get the names of the new feeds. And finally when we get
             # the 'changing parameters' message we'll update the analyzers.
             #
+            response_data = {"old parameters" : self.parameters.copy()}
             message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"old parameters" : self.parameters.copy()}))
+                                                              data = response_data))
             self.parameters = message.getData()["parameters"].get(self.module_name)
-            message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"new parameters" : self.parameters}))
+            response_data["new parameters"] = self.parameters
             
         elif message.isType("show"):
             if (message.getData()["show"] == "spot counter"):
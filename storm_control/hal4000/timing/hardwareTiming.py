@@ -191,13 +191,13 @@ class HardwareTiming(halModule.HalModule):
             #        to late to change the allowed range that settings.settings will show
             #        in the parameter editor GUI.
             #
+            response_data = {"old parameters" : self.parameters.copy()}
             message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"old parameters" : self.parameters.copy()}))
+                                                              data = response_data))
             p = message.getData()["parameters"].get(self.module_name)
             self.parameters.setv("fps", p.get("fps"))
             self.hardware_timing_functionality.setFPS(p.get("fps"))
-            message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"new parameters" : self.parameters}))
+            response_data["new parameters"] = self.parameters
 
         elif message.isType("start"):
             if self.hardware_timing_functionality is None:
@@ -144,13 +144,13 @@ class Timing(halModule.HalModule):
             #        parameter that it has only allows one value. Somehow we need to know
             #        the valid feed names at the new parameter stage..
             #
+            response_data = {"old parameters" : self.parameters.copy()}
             message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"old parameters" : self.parameters.copy()}))
+                                                              data = response_data))
             p = message.getData()["parameters"].get(self.module_name)
             self.setAllowed([p.get("time_base")])
             self.parameters.setv("time_base", p.get("time_base"))
-            message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"new parameters" : self.parameters}))
+            response_data["new parameters"] = self.parameters
 
         elif message.isType("start film"):
             self.timing_functionality = TimingFunctionality(time_base = self.parameters.get("time_base"))
@@ -207,12 +207,12 @@ class W1SpinDiskModule(hardwareModule.HardwareModule):
                                            lambda : self.updateParameters(message))
 
     def updateParameters(self, message):
+        response_data = {"old parameters" : self.control.getParameters().copy()}
         message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                          data = {"old parameters" : self.control.getParameters().copy()}))
+                                                          data = response_data))
         p = message.getData()["parameters"].get(self.module_name)
         self.control.newParameters(p)
-        message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                          data = {"new parameters" : self.control.getParameters()}))
+        response_data["new parameters"] = self.control.getParameters()
 
 #
 # The MIT License
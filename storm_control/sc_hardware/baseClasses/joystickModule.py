@@ -306,11 +306,11 @@ class JoystickModule(halModule.HalModule):
 
         elif message.isType("new parameters"):
             p = message.getData()["parameters"]
+            response_data = {"old parameters" : self.control.getParameters().copy()}
             message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"old parameters" : self.control.getParameters().copy()}))
+                                                              data = response_data))
             self.control.newParameters(p.get(self.module_name))
-            message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
-                                                              data = {"new parameters" : self.control.getParameters()}))
+            response_data["new parameters"] = self.control.getParameters()
 
         elif message.isType("stop film"):
             message.addResponse(halMessage.HalMessageResponse(source = self.module_name,
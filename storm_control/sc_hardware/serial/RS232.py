@@ -47,30 +47,33 @@ class RS232(object):
     def commWithResp(self, command):
         """
         Send a command and wait (a little) for a response.
+
+        Poll for the first bytes of the response instead of always
+        sleeping for the maximum wait time, so that fast hardware does
+        not pay a fixed length delay on every exchange.
         """
         self.sendCommand(command)
-        time.sleep(10 * self.wait_time)
-        response = ""
-        response_len = self.tty.inWaiting()
-        while response_len:
-            response += self.read(response_len)
+        end_time = time.time() + 10 * self.wait_time
+        while (self.tty.inWaiting() == 0) and (time.time() < end_time):
             time.sleep(self.wait_time)
-            response_len = self.tty.inWaiting()
-        if len(response) > 0:
-            return response
+        return self.getResponse()
 
     def getResponse(self):
         """
         Wait (a little) for a response.
+
+        The raw bytes are accumulated in a buffer and decoded once at
+        the end, rather than decoding and concatenating strings chunk
+        by chunk.
         """
-        response = ""
+        response = bytearray()
         response_len = self.tty.inWaiting()
         while response_len:
-            response += self.read(response_len)
+            response.extend(self.tty.read(response_len))
             time.sleep(self.wait_time)
             response_len = self.tty.inWaiting()
         if len(response) > 0:
-            return response
+            return response.decode(self.encoding)
 
     def getStatus(self):
         """
@@ -107,17 +110,18 @@ class RS232(object):
         """
         if not end_of_response:
             end_of_response = str(self.end_of_line)
+        end_of_response = end_of_response.encode(self.encoding)
         attempts = 0
-        response = ""
+        response = bytearray()
         index = -1
         while (index == -1) and (attempts < max_attempts):
             response_len = self.tty.inWaiting()
             if response_len > 0:
-                response += self.read(response_len)
+                response.extend(self.tty.read(response_len))
             time.sleep(self.wait_time)
             index = response.find(end_of_response)
             attempts += 1
-        return response
+        return response.decode(self.encoding)
 
     def write(self, string):
         self.tty.write(string.encode(self.encoding))
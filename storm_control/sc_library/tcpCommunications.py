@@ -63,6 +63,10 @@ class TCPCommunicationsMixin(object):
             # Read data line
             message_str += str(self.socket.readLine(), self.encoding)
 
+        # Don't try to parse anything if no complete line was available.
+        if not message_str:
+            return
+
         # Create message.
         message = TCPMessage.fromJSON(message_str)
         if self.verbose: